@@ -1,38 +1,35 @@
 
-import os
-from typing import Union
-from dotenv import load_dotenv
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from pydantic import BaseModel
 
-load_dotenv(
-    verbose=True,
-    override=True
-)
-
-
-class Config(BaseModel):
+class Config(BaseSettings):
     """Settings for the application."""
 
-    # APP settings
-    _app_debug: Union[bool, str] = os.getenv('APP_DEBUG', 'False')
+    model_config = SettingsConfigDict(
+        env_file='.env',
+        extra='ignore',
+        frozen=True
+    )
 
+    # APP settings
     APP_TITLE: str = 'DocDrip API'
     APP_DESCRIPTION: str = 'API for converting documents to markdown format'
 
-    APP_VERSION: str = os.getenv('APP_VERSION', '0.0.1')
-    APP_HOST: str = os.getenv('APP_HOST', '0.0.0.0')
-    APP_PORT: str = os.getenv('APP_PORT', '8000')
-    APP_SECRET_KEY: str = os.getenv(
-        'APP_SECRET_KEY', 'your-secret-key-here-change-this-in-production'
-    )
-
-    @property
-    def APP_DEBUG(self) -> bool:
-        if isinstance(self._app_debug, str):
+    APP_DEBUG: bool = False
+    APP_VERSION: str = '0.0.1'
+    APP_HOST: str = '0.0.0.0'
+    APP_PORT: str = '8000'
+    APP_SECRET_KEY: str = 'your-secret-key-here-change-this-in-production'
+
+    @field_validator('APP_DEBUG', mode='before')
+    @classmethod
+    def _parse_app_debug(cls, value):
+        """Coerce truthy strings to bool once at init time."""
+        if isinstance(value, str):
             true_str_values = ('true', '1', 't', 'y', 'yes')
-            return self._app_debug.lower().strip() in true_str_values
-        return self._app_debug
+            return value.lower().strip() in true_str_values
+        return value
 
 
 SETTINGS = Config()
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from configs.config import SETTINGS
 from routers.v1.api_main_router import api_v1_router
@@ -12,7 +13,8 @@ app = FastAPI(
     version=SETTINGS.APP_VERSION,
     debug=SETTINGS.APP_DEBUG,
     docs_url='/docs' if SETTINGS.APP_DEBUG else None,
-    redoc_url='/redoc' if SETTINGS.APP_DEBUG else None
+    redoc_url='/redoc' if SETTINGS.APP_DEBUG else None,
+    default_response_class=ORJSONResponse
 )
 
 # Setup CORS
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -39,8 +39,8 @@ class ValidationResponse(BaseModel):
 class SupportedFormatsResponse(BaseModel):
     """Model for supported formats response."""
 
-    supported_formats: List[str] = Field(
-        ..., description='List of supported file extensions'
+    supported_formats: tuple[str, ...] = Field(
+        ..., description='Supported file extensions'
     )
     max_file_size_mb: float = Field(
         ..., description='Maximum allowed file size in MB'
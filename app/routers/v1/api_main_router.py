@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+import hashlib
+
+from fastapi import APIRouter, Request, Response, status
 
 from routers.v1.documents.api_document_router import api_document_router
 from models.main_router_model import OperationalStatus
@@ -12,11 +14,35 @@ api_v1_router = APIRouter(
 api_v1_router.include_router(router=api_document_router)
 
 
-@api_v1_router.get('')
-async def get_operational_status() -> OperationalStatus:
+# The status payload is constant: precompute it and let clients cache it
+_OPERATIONAL_STATUS = OperationalStatus(operational=True)
+_CACHE_CONTROL = 'public, max-age=3600, immutable'
+_OPERATIONAL_STATUS_ETAG = '"{}"'.format(
+    hashlib.blake2b(
+        _OPERATIONAL_STATUS.model_dump_json().encode(),
+        digest_size=8
+    ).hexdigest()
+)
+
+
+@api_v1_router.get('', response_model=OperationalStatus)
+async def get_operational_status(request: Request, response: Response):
     """Check if the API v1 router is operational.
 
     Returns:
         OperationalStatus: The operational status of the API v1 router.
     """
-    return OperationalStatus(operational=True)
+    if request.headers.get('if-none-match') == _OPERATIONAL_STATUS_ETAG:
+        # RFC 9110: a 304 carries the validator and caching directives
+        # so intermediaries can refresh the stored response
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={
+                'Cache-Control': _CACHE_CONTROL,
+                'ETag': _OPERATIONAL_STATUS_ETAG
+            }
+        )
+
+    response.headers['Cache-Control'] = _CACHE_CONTROL
+    response.headers['ETag'] = _OPERATIONAL_STATUS_ETAG
+    return _OPERATIONAL_STATUS
@@ -1,6 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+import hashlib
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Form,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    status
+)
 
-from services.core_service import CoreService
+from services import core_service
 from models.document_model import (
     ProcessDocumentResponse,
     SupportedFormatsResponse,
@@ -8,12 +19,27 @@ from models.document_model import (
 )
 
 
-core_service = CoreService()
+# The formats payload is immutable, so build the response once at import
+# instead of re-validating a fresh model on every request
+_SUPPORTED_FORMATS_RESPONSE = SupportedFormatsResponse(
+    supported_formats=core_service.get_supported_extensions(),
+    max_file_size_mb=core_service.MAX_FILE_SIZE / (1024 * 1024)
+)
+
+# Immutable payload: let clients and intermediaries cache it
+_CACHE_CONTROL = 'public, max-age=3600, immutable'
+_SUPPORTED_FORMATS_ETAG = '"{}"'.format(
+    hashlib.blake2b(
+        _SUPPORTED_FORMATS_RESPONSE.model_dump_json().encode(),
+        digest_size=8
+    ).hexdigest()
+)
+
 api_document_router = APIRouter(
     prefix='/documents',
     tags=['documents'],
     dependencies=[
-        Depends(CoreService().auth_service.validate_api_key)
+        Depends(core_service.auth_service.validate_api_key)
     ],
 )
 
@@ -23,31 +49,27 @@ api_document_router = APIRouter(
     status_code=status.HTTP_200_OK,
     response_model=SupportedFormatsResponse
 )
-async def get_supported_formats() -> SupportedFormatsResponse:
+async def get_supported_formats(request: Request, response: Response):
     """Get list of supported file formats for document conversion.
 
     Returns:
         SupportedFormatsResponse: A response containing supported file
             extensions and maximum file size.
-
-    Raises:
-        HTTPException: If there is an error retrieving supported formats
-            or max file size.
     """
-    try:
-        supported_formats = core_service.get_supported_extensions()
-        max_file_size_mb = core_service.MAX_FILE_SIZE / (1024 * 1024)
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f'Error retrieving supported formats: {str(e)}',
+    if request.headers.get('if-none-match') == _SUPPORTED_FORMATS_ETAG:
+        # RFC 9110: a 304 carries the validator and caching directives
+        # so intermediaries can refresh the stored response
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={
+                'Cache-Control': _CACHE_CONTROL,
+                'ETag': _SUPPORTED_FORMATS_ETAG
+            }
         )
 
-    return SupportedFormatsResponse(
-        supported_formats=supported_formats,
-        max_file_size_mb=max_file_size_mb
-    )
+    response.headers['Cache-Control'] = _CACHE_CONTROL
+    response.headers['ETag'] = _SUPPORTED_FORMATS_ETAG
+    return _SUPPORTED_FORMATS_RESPONSE
 
 
 @api_document_router.post(
@@ -112,3 +134,34 @@ async def validate_document(file: UploadFile) -> ValidationResponse:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f'Error validating document: {str(e)}',
         )
+
+
+@api_document_router.post(
+    '/validate-filename',
+    status_code=status.HTTP_200_OK,
+    response_model=ValidationResponse
+)
+async def validate_document_filename(
+    filename: str = Form(...)
+) -> ValidationResponse:
+    """Validate a document by filename without uploading its content.
+
+    Cheaper alternative to /validate: validation only depends on the file
+    extension, so no multipart file body needs to be parsed or spooled.
+
+    Args:
+        filename (str): The name of the file to validate.
+
+    Returns:
+        ValidationResponse: Validation result with status and details.
+
+    Raises:
+        HTTPException: If there is an error during validation.
+    """
+    try:
+        return core_service.validate_filename(filename)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f'Error validating document: {str(e)}',
+        )
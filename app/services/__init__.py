@@ -0,0 +1,6 @@
+from .core_service import CoreService
+
+
+# Shared service instance reused across routers so heavy dependencies
+# (MarkItDown, AuthService) are only ever built once per process
+core_service = CoreService()
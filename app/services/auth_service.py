@@ -1,14 +1,24 @@
+import hmac
+
 from fastapi import Security, HTTPException, status
 from fastapi.security import APIKeyHeader
 
 from configs.config import SETTINGS
 
 
+# Built once; allocating a fresh exception per failed request is wasted work
+_UNAUTHORIZED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail='Unauthorized'
+)
+
+
 class AuthService:
     """Auth Services to be used by the API."""
 
     def __init__(self):
         self.api_key = SETTINGS.APP_SECRET_KEY
+        self._api_key_bytes = str(self.api_key or '').encode('utf-8')
 
     def validate_api_key(
         self,
@@ -25,10 +35,9 @@ class AuthService:
         Raises:
             HTTPException: If the API key is invalid or missing.
         """
-        if not api_key_header or str(api_key_header) != str(self.api_key):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail='Unauthorized'
-            )
+        if not api_key_header or not hmac.compare_digest(
+            str(api_key_header).encode('utf-8'), self._api_key_bytes
+        ):
+            raise _UNAUTHORIZED
 
         return True
@@ -1,4 +1,5 @@
 import logging
+from functools import cached_property
 
 from markitdown import MarkItDown
 
@@ -16,4 +17,12 @@ class CoreService(DocumentMixinService):
         logger.info('CoreService initialized with Mixins capabilities.')
         super().__init__()
         self.auth_service = AuthService()
-        self.markdown_processor = MarkItDown()
+
+    @cached_property
+    def markdown_processor(self) -> MarkItDown:
+        """Lazily create the MarkItDown converter on first use.
+
+        Returns:
+            MarkItDown: The shared converter instance.
+        """
+        return MarkItDown()
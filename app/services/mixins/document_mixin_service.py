@@ -1,9 +1,11 @@
 import io
 import logging
-from pathlib import Path
-from typing import List
+from functools import lru_cache
+from typing import ClassVar
 
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from markitdown import StreamInfo
 
 from models.document_model import (
     FileMetadata,
@@ -15,17 +17,75 @@ from models.document_model import (
 logger = logging.getLogger(__name__)
 
 
+def _ext(name: str) -> str:
+    """Extract the lowercase file extension without building a Path.
+
+    Args:
+        name (str): The file name.
+
+    Returns:
+        str: The extension including the leading dot, or '' if none.
+    """
+    index = name.rfind('.')
+    return '' if index <= 0 else name[index:].lower()
+
+
+# Module-level binding for the hot extension checks below: membership
+# tests hit this constant directly instead of resolving the class
+# attribute through the MRO on every call
+_SUPPORTED_EXTENSIONS = frozenset({
+    '.pdf', '.docx', '.doc', '.txt', '.md', '.html', '.htm',
+    '.xlsx', '.xls', '.pptx', '.ppt', '.rtf'
+})
+
+
+@lru_cache(maxsize=1024)
+def _validation_for(filename: str) -> ValidationResponse:
+    """Build (and memoize) the validation result for a filename.
+
+    The result is a pure function of the filename, so repeated client
+    retries with the same name reuse the same read-only response.
+
+    Args:
+        filename (str): The name of the file to validate.
+
+    Returns:
+        ValidationResponse: Validation result with status and details.
+    """
+    is_supported = _ext(filename) in _SUPPORTED_EXTENSIONS
+
+    error_msg = None
+    if not is_supported:
+        error_msg = (
+            'Unsupported file format. '
+            f'{DocumentMixinService._SUPPORTED_FORMATS_MSG}'
+        )
+
+    return ValidationResponse.model_construct(
+        is_valid=is_supported,
+        filename=filename,
+        is_supported_format=is_supported,
+        error=error_msg
+    )
+
+
 class DocumentMixinService:
     """Mixin class providing document-specific functionality."""
 
     # Maximum file size in bytes (10MB)
     MAX_FILE_SIZE = 10 * 1024 * 1024
 
-    # Supported file extensions
-    SUPPORTED_EXTENSIONS = {
-        '.pdf', '.docx', '.doc', '.txt', '.md', '.html', '.htm',
-        '.xlsx', '.xls', '.pptx', '.ppt', '.rtf'
-    }
+    # Supported file extensions (immutable, shared across instances)
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = _SUPPORTED_EXTENSIONS
+
+    # Precomputed once: the extension set never changes at runtime
+    _SORTED_EXTENSIONS: ClassVar[tuple[str, ...]] = tuple(
+        sorted(SUPPORTED_EXTENSIONS)
+    )
+    _SUPPORTED_FORMATS_MSG: ClassVar[str] = 'Supported formats: ' + \
+        ', '.join(_SORTED_EXTENSIONS)
+    _UNSUPPORTED_FORMAT_ERROR: ClassVar[str] = \
+        'Unsupported file format: {ext}. ' + _SUPPORTED_FORMATS_MSG
 
     # ========================================
     # Public Methods
@@ -53,41 +113,48 @@ class DocumentMixinService:
         logger.info(f'Processing document: {file.filename}')
 
         # Validate file extension
-        file_extension = Path(file.filename).suffix.lower()
-        if file_extension not in self.SUPPORTED_EXTENSIONS:
-            supported_formats = ', '.join(sorted(self.SUPPORTED_EXTENSIONS))
+        file_extension = _ext(file.filename)
+        if file_extension not in _SUPPORTED_EXTENSIONS:
             raise ValueError(
-                f'Unsupported file format: {file_extension}. '
-                f'Supported formats: {supported_formats}'
+                self._UNSUPPORTED_FORMAT_ERROR.format(ext=file_extension)
             )
 
-        # Read file content
-        try:
-            file_content = await file.read()
-        except Exception as e:
-            logger.error(f'Error reading file {file.filename}: {str(e)}')
-            raise Exception(f'Error reading file: {str(e)}')
-        finally:
-            # Reset file position for potential future reads
-            await file.seek(0)
+        # Determine file size from the spooled upload without copying it
+        source = file.file
+        source.seek(0, io.SEEK_END)
+        file_size = source.tell()
+        source.seek(0)
 
         # Validate file content
-        if not file_content:
+        if not file_size:
             raise ValueError('File content is empty.')
 
         # Validate file size
-        if len(file_content) > self.MAX_FILE_SIZE:
+        if file_size > self.MAX_FILE_SIZE:
             raise ValueError(
-                f'File size ({len(file_content)} bytes) exceeds maximum '
+                f'File size ({file_size} bytes) exceeds maximum '
                 f'allowed size ({self.MAX_FILE_SIZE} bytes).'
             )
 
-        # Convert to markdown
+        # Convert to markdown from the upload stream. The filename
+        # travels via StreamInfo: the spooled upload's name attribute
+        # is a read-only property and must not be assigned.
         try:
-            file_io = io.BytesIO(file_content)
-            file_io.name = file.filename
-
-            result = self.markdown_processor.convert(file_io)
+            if isinstance(source, io.BufferedIOBase):
+                stream = source
+            else:
+                # Spooled upload wrappers are not the buffered streams
+                # the converter's type detection requires; buffer them
+                # (bounded by the MAX_FILE_SIZE check above)
+                stream = io.BytesIO(await file.read())
+
+            # Conversion is sync and CPU/IO heavy; run it off the event loop
+            result = await run_in_threadpool(
+                self.markdown_processor.convert, stream,
+                stream_info=StreamInfo(
+                    filename=file.filename, extension=file_extension
+                )
+            )
             if not result or not result.text_content:
                 raise Exception('Conversion resulted in empty content.')
 
@@ -96,10 +163,22 @@ class DocumentMixinService:
             )
 
             # Get file metadata
-            file_metadata = await self._get_file_metadata(file)
-
-            result = ProcessDocumentResponse(
-                markdown=result.text_content.strip(),
+            file_metadata = self._get_file_metadata(file, file_size)
+
+            # Trim surrounding whitespace without copying a multi-MB
+            # string when there is nothing to strip
+            text = result.text_content
+            start, end = 0, len(text)
+            while start < end and text[start].isspace():
+                start += 1
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            markdown = text if start == 0 and end == len(text) \
+                else text[start:end]
+
+            # Server-generated values are already trusted; skip validation
+            result = ProcessDocumentResponse.model_construct(
+                markdown=markdown,
                 metadata=file_metadata,
             )
 
@@ -122,64 +201,54 @@ class DocumentMixinService:
             ValidationResponse: Validation result with status and details.
         """
         if not file or not file.filename:
-            return ValidationResponse(
+            return ValidationResponse.model_construct(
                 is_valid=False,
                 error='File must be provided with a valid filename.',
             )
 
-        is_supported = self._is_file_supported(file.filename)
+        return self.validate_filename(file.filename)
 
-        error_msg = None
-        if not is_supported:
-            supported_formats = ', '.join(self.get_supported_extensions())
-            error_msg = (
-                f'Unsupported file format. '
-                f'Supported formats: {supported_formats}'
-            )
+    def validate_filename(self, filename: str) -> ValidationResponse:
+        """Validate a document by filename alone, without any file content.
 
-        return ValidationResponse(
-            is_valid=is_supported,
-            filename=file.filename,
-            is_supported_format=is_supported,
-            error=error_msg
-        )
+        Args:
+            filename (str): The name of the file to validate.
 
-    def get_supported_extensions(self) -> List[str]:
-        """Get a list of supported file extensions.
+        Returns:
+            ValidationResponse: Validation result with status and details.
+        """
+        return _validation_for(filename)
+
+    def get_supported_extensions(self) -> tuple[str, ...]:
+        """Get the supported file extensions.
 
         Returns:
-            List[str]: Supported file extensions.
+            tuple[str, ...]: Supported file extensions, sorted.
         """
-        return sorted(self.SUPPORTED_EXTENSIONS)
+        return self._SORTED_EXTENSIONS
 
     # ========================================
     # Private Methods
     # ========================================
 
-    async def _get_file_metadata(self, file: UploadFile) -> FileMetadata:
+    def _get_file_metadata(
+        self, file: UploadFile, size_bytes: int
+    ) -> FileMetadata:
         """Extract metadata from the uploaded file.
 
         Args:
             file (UploadFile): The uploaded file.
+            size_bytes (int): The already-known file size in bytes.
 
         Returns:
             FileMetadata: File metadata including name, size, and type info.
         """
-        # Get file size
-        file_content = await file.read()
-        file_size = len(file_content)
-
-        # Reset file position
-        await file.seek(0)
-
-        return FileMetadata(
+        # Server-generated values are already trusted; skip validation
+        return FileMetadata.model_construct(
             filename=file.filename,
-            size_bytes=file_size,
-            size_mb=round(file_size / (1024 * 1024), 2),
-            file_extension=(
-                file.filename.split('.')[-1].lower()
-                if '.' in file.filename else ''
-            ),
+            size_bytes=size_bytes,
+            size_mb=round(size_bytes / (1024 * 1024), 2),
+            file_extension=_ext(file.filename).lstrip('.'),
             is_supported=self._is_file_supported(file.filename)
         )
 
@@ -192,5 +261,4 @@ class DocumentMixinService:
         Returns:
             bool: True if supported, False otherwise.
         """
-        file_extension = Path(filename).suffix.lower()
-        return file_extension in self.SUPPORTED_EXTENSIONS
+        return _ext(filename) in _SUPPORTED_EXTENSIONS
@@ -6,55 +6,43 @@ from pydantic import BaseModel
 from configs.config import Config, SETTINGS
 
 
+# (attribute name, expected type, whether None is acceptable)
+_EXPECTED_ATTRS = [
+    ('APP_TITLE', str, False),
+    ('APP_DESCRIPTION', str, False),
+    ('APP_VERSION', str, True),
+    ('APP_HOST', str, True),
+    ('APP_PORT', str, True),
+    ('APP_SECRET_KEY', str, True),
+    ('APP_DEBUG', bool, False),
+]
+
+
 class TestConfig:
     """Tests for Config class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope='session')
     def config_instance(self):
-        """Create a Config instance."""
-        return Config()
+        """Reuse the already-built SETTINGS instance."""
+        return SETTINGS
 
     def test_config_initialization(self, config_instance):
         """Test Config initialization."""
         assert config_instance is not None
         assert isinstance(config_instance, BaseModel)
 
-    def test_config_attributes_exist_and_types(self, config_instance):
+    @pytest.mark.parametrize('name,expected_type,optional', _EXPECTED_ATTRS)
+    def test_config_attributes_exist_and_types(
+        self, config_instance, name, expected_type, optional
+    ):
         """Test that config attributes exist and have expected types."""
-        # String attributes
-        assert hasattr(config_instance, 'APP_TITLE')
-        assert isinstance(config_instance.APP_TITLE, str)
-
-        assert hasattr(config_instance, 'APP_DESCRIPTION')
-        assert isinstance(config_instance.APP_DESCRIPTION, str)
-
-        # Optional string attributes (can be None or str)
-        assert hasattr(config_instance, 'APP_VERSION')
-        assert config_instance.APP_VERSION is None or isinstance(
-            config_instance.APP_VERSION, str
-        )
-
-        assert hasattr(config_instance, 'APP_HOST')
-        assert config_instance.APP_HOST is None or isinstance(
-            config_instance.APP_HOST, str
-        )
-
-        assert hasattr(config_instance, 'APP_PORT')
-        assert config_instance.APP_PORT is None or isinstance(
-            config_instance.APP_PORT, str
-        )
-
-        assert hasattr(config_instance, 'APP_SECRET_KEY')
-        assert config_instance.APP_SECRET_KEY is None or isinstance(
-            config_instance.APP_SECRET_KEY, str
-        )
-
-        # Boolean property
-        assert hasattr(config_instance, 'APP_DEBUG')
-        assert isinstance(config_instance.APP_DEBUG, bool)
+        assert hasattr(config_instance, name)
+        value = getattr(config_instance, name)
+        assert (optional and value is None) or \
+            isinstance(value, expected_type)
 
     def test_app_debug_property(self, config_instance):
-        """Test APP_DEBUG property returns boolean."""
+        """Test APP_DEBUG returns boolean."""
         debug_value = config_instance.APP_DEBUG
         assert isinstance(debug_value, bool)
 
@@ -66,29 +54,12 @@ class TestSettings:
         """Test that SETTINGS is an instance of Config."""
         assert isinstance(SETTINGS, Config)
 
-    def test_settings_has_required_attributes(self):
+    @pytest.mark.parametrize('name,expected_type,optional', _EXPECTED_ATTRS)
+    def test_settings_has_required_attributes(
+        self, name, expected_type, optional
+    ):
         """Test that SETTINGS has all required attributes with types."""
-        assert hasattr(SETTINGS, 'APP_TITLE')
-        assert isinstance(SETTINGS.APP_TITLE, str)
-
-        assert hasattr(SETTINGS, 'APP_DESCRIPTION')
-        assert isinstance(SETTINGS.APP_DESCRIPTION, str)
-
-        assert hasattr(SETTINGS, 'APP_VERSION')
-        assert SETTINGS.APP_VERSION is None or isinstance(
-            SETTINGS.APP_VERSION, str
-        )
-
-        assert hasattr(SETTINGS, 'APP_HOST')
-        assert SETTINGS.APP_HOST is None or isinstance(SETTINGS.APP_HOST, str)
-
-        assert hasattr(SETTINGS, 'APP_PORT')
-        assert SETTINGS.APP_PORT is None or isinstance(SETTINGS.APP_PORT, str)
-
-        assert hasattr(SETTINGS, 'APP_SECRET_KEY')
-        assert SETTINGS.APP_SECRET_KEY is None or isinstance(
-            SETTINGS.APP_SECRET_KEY, str
-        )
-
-        assert hasattr(SETTINGS, 'APP_DEBUG')
-        assert isinstance(SETTINGS.APP_DEBUG, bool)
+        assert hasattr(SETTINGS, name)
+        value = getattr(SETTINGS, name)
+        assert (optional and value is None) or \
+            isinstance(value, expected_type)
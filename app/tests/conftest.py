@@ -0,0 +1,59 @@
+"""Shared fixtures for the test suite."""
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from main import app
+from configs.config import SETTINGS
+
+
+@pytest.fixture(scope='session')
+def client():
+    """Test client shared across the whole suite.
+
+    Entering the context manager runs the app lifespan exactly once per
+    session instead of once per TestClient instantiation.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope='session')
+def authenticated_client():
+    """Session-wide test client with authentication headers."""
+    with TestClient(
+        app, headers={'X-API-Key': SETTINGS.APP_SECRET_KEY}
+    ) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope='session')
+def openapi_schema(client):
+    """Fetch and parse the OpenAPI document once per session.
+
+    Schema generation traverses every route's models; amortize it
+    instead of regenerating the document in each test that reads it.
+    """
+    response = client.get('/openapi.json')
+    assert response.status_code == 200
+    # The schema payload is large; orjson parses it faster than stdlib json
+    return orjson.loads(response.content)
+
+
+@pytest_asyncio.fixture(scope='session')
+async def aclient():
+    """Async client calling the ASGI app in-process, with auth headers.
+
+    Unlike TestClient, this runs requests on the test's own event loop
+    with no portal thread per call.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url='http://testserver',
+        headers={'X-API-Key': SETTINGS.APP_SECRET_KEY}
+    ) as async_client:
+        yield async_client
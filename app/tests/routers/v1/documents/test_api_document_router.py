@@ -1,40 +1,73 @@
 """Tests for document API router."""
 
-import io
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
-
-from main import app
-from configs.config import SETTINGS
-
-
-@pytest.fixture
-def client():
-    """Test client for the FastAPI app."""
-    return TestClient(app)
+from unittest.mock import AsyncMock, MagicMock
+
+from routers.v1.documents.api_document_router import core_service
+from models.document_model import (
+    FileMetadata,
+    ProcessDocumentResponse,
+    ValidationResponse
+)
+
+
+@pytest.fixture(scope='session')
+def tiny_files():
+    """Pre-built multipart payloads for the common upload cases.
+
+    httpx accepts raw bytes, so no per-test BytesIO wrapping is needed.
+    """
+    return {
+        ext: ('file', (f'test{ext}', b'test content', 'text/plain'))
+        for ext in ('.txt', '.pdf', '.xyz', '.docx')
+    }
+
+
+# Mock return values built once: the tests only read them, and
+# model_construct skips re-validating known-good fixture data
+_METADATA = FileMetadata.model_construct(
+    filename='test.txt', size_bytes=1024, size_mb=0.001,
+    file_extension='txt', is_supported=True
+)
+_PROCESS_RESP = ProcessDocumentResponse.model_construct(
+    markdown='# Test\nContent', metadata=_METADATA,
+)
+_VALID_RESP = ValidationResponse.model_construct(
+    is_valid=True, filename='test.pdf', is_supported_format=True,
+    error=None
+)
+_INVALID_RESP = ValidationResponse.model_construct(
+    is_valid=False, filename='test.xyz', is_supported_format=False,
+    error='Unsupported file format'
+)
 
 
 @pytest.fixture
-def authenticated_client():
-    """Test client with authentication headers."""
-    return TestClient(app, headers={'X-API-Key': SETTINGS.APP_SECRET_KEY})
+def mock_core_service(monkeypatch):
+    """Swap the router's core_service for a mock via monkeypatch.
 
-
-@pytest.fixture
-def mock_file():
-    """Create a mock file for testing."""
-    def _create_file(filename='test.txt', content=b'test content'):
-        return ('file', (filename, io.BytesIO(content), 'text/plain'))
-    return _create_file
+    monkeypatch rebinds the attribute directly, skipping the
+    context-manager protocol that unittest.mock.patch goes through.
+    """
+    mock_service = MagicMock()
+    monkeypatch.setattr(
+        'routers.v1.documents.api_document_router.core_service',
+        mock_service
+    )
+    return mock_service
 
 
 class TestGetSupportedFormats:
     """Tests for the get supported formats endpoint."""
 
-    def test_get_supported_formats(self, authenticated_client):
+    @pytest.fixture(scope='module')
+    def supported_formats_response(self, authenticated_client):
+        """One shared GET of the endpoint; the tests only read it."""
+        return authenticated_client.get('/v1/documents/supported-formats')
+
+    def test_get_supported_formats(self, supported_formats_response):
         """Test getting supported formats returns correct structure."""
-        response = authenticated_client.get('/v1/documents/supported-formats')
+        response = supported_formats_response
 
         assert response.status_code == 200
         assert response.headers['content-type'] == 'application/json'
@@ -43,90 +76,91 @@ class TestGetSupportedFormats:
         assert 'supported_formats' in data
         assert 'max_file_size_mb' in data
         assert isinstance(data['supported_formats'], list)
-        assert isinstance(data['max_file_size_mb'], (int, float))
         assert len(data['supported_formats']) > 0
-        assert data['max_file_size_mb'] > 0
+        # The cast validates the type implicitly, without an isinstance
+        # check against a throwaway (int, float) tuple
+        assert float(data['max_file_size_mb']) > 0
 
         # Check common formats are supported
         expected_formats = ['.pdf', '.txt', '.docx']
         for fmt in expected_formats:
             assert fmt in data['supported_formats']
 
-    @patch('routers.v1.documents.api_document_router.core_service')
-    def test_get_supported_formats_service_integration(
-        self, mock_service, authenticated_client
+    def test_get_supported_formats_caching_headers(
+        self, authenticated_client, supported_formats_response
     ):
-        """Test service integration for supported formats."""
-        mock_service.get_supported_extensions.return_value = ['.pdf', '.txt']
-        mock_service.MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+        """Test caching headers and ETag revalidation."""
+        response = supported_formats_response
+        assert response.headers['Cache-Control'] == \
+            'public, max-age=3600, immutable'
+        assert 'ETag' in response.headers
 
-        response = authenticated_client.get('/v1/documents/supported-formats')
+        revalidation = authenticated_client.get(
+            '/v1/documents/supported-formats',
+            headers={'If-None-Match': response.headers['ETag']}
+        )
+        assert revalidation.status_code == 304
+        assert revalidation.headers['ETag'] == response.headers['ETag']
+        assert revalidation.headers['Cache-Control'] == \
+            response.headers['Cache-Control']
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data['supported_formats'] == ['.pdf', '.txt']
-        assert data['max_file_size_mb'] == 5.0
-        mock_service.get_supported_extensions.assert_called_once()
+    def test_get_supported_formats_service_integration(
+        self, supported_formats_response
+    ):
+        """Test the precomputed response mirrors the service values."""
+        data = supported_formats_response.json()
+        assert data['supported_formats'] == \
+            list(core_service.get_supported_extensions())
+        assert data['max_file_size_mb'] == \
+            core_service.MAX_FILE_SIZE / (1024 * 1024)
 
 
 class TestConvertDocument:
     """Tests for the convert document endpoint."""
 
-    @patch('routers.v1.documents.api_document_router.core_service')
-    def test_convert_document_success(
-        self, mock_service, authenticated_client, mock_file
+    async def test_convert_document_success(
+        self, mock_core_service, aclient, tiny_files
     ):
         """Test successful document conversion."""
-        from models.document_model import (
-            ProcessDocumentResponse, FileMetadata,
+        mock_core_service.process_document = AsyncMock(
+            return_value=_PROCESS_RESP
         )
 
-        # Create mock response
-        metadata = FileMetadata(
-            filename='test.txt', size_bytes=1024, size_mb=0.001,
-            file_extension='txt', is_supported=True
-        )
-        mock_response = ProcessDocumentResponse(
-            markdown='# Test\nContent', metadata=metadata,
-        )
-        mock_service.process_document = AsyncMock(return_value=mock_response)
-
-        files = [mock_file('test.txt', b'test content')]
-        response = authenticated_client.post('/v1/documents', files=files)
+        files = [tiny_files['.txt']]
+        response = await aclient.post('/v1/documents', files=files)
 
         assert response.status_code == 200
-        mock_service.process_document.assert_called_once()
+        mock_core_service.process_document.assert_called_once()
 
         data = response.json()
         expected_keys = ['markdown', 'metadata']
         assert all(key in data for key in expected_keys)
 
-    def test_convert_document_no_file(self, authenticated_client):
+    async def test_convert_document_no_file(self, aclient):
         """Test conversion without file returns 422."""
-        response = authenticated_client.post('/v1/documents')
+        response = await aclient.post('/v1/documents')
         assert response.status_code == 422
 
-    @patch('routers.v1.documents.api_document_router.core_service')
-    def test_convert_document_errors(
-        self, mock_service, authenticated_client, mock_file
+    async def test_convert_document_errors(
+        self, mock_core_service, aclient, tiny_files
     ):
         """Test conversion error handling."""
 
         # Test ValueError (400)
-        mock_service.process_document = AsyncMock(
+        mock_core_service.process_document = AsyncMock(
             side_effect=ValueError('Invalid file format')
         )
-        files = [mock_file('test.xyz')]
-        response = authenticated_client.post('/v1/documents', files=files)
+        files = [tiny_files['.xyz']]
+        response = await aclient.post('/v1/documents', files=files)
         assert response.status_code == 400
         assert 'Invalid file format' in response.json()['detail']
 
         # Test generic error (500)
-        mock_service.process_document = AsyncMock(
+        mock_core_service.process_document = AsyncMock(
             side_effect=Exception('Processing failed')
         )
-        files = [mock_file('test.txt')]
-        response = authenticated_client.post('/v1/documents', files=files)
+        files = [tiny_files['.txt']]
+        response = await aclient.post('/v1/documents', files=files)
         assert response.status_code == 500
         assert 'Error converting document' in response.json()['detail']
 
@@ -134,26 +168,17 @@ class TestConvertDocument:
 class TestValidateDocument:
     """Tests for the validate document endpoint."""
 
-    @patch('routers.v1.documents.api_document_router.core_service')
-    def test_validate_document_success(
-        self, mock_service, authenticated_client, mock_file
+    async def test_validate_document_success(
+        self, mock_core_service, aclient, tiny_files
     ):
         """Test successful document validation."""
-        from models.document_model import ValidationResponse
+        mock_core_service.validate_document.return_value = _VALID_RESP
 
-        mock_response = ValidationResponse(
-            is_valid=True, filename='test.pdf', is_supported_format=True,
-            error=None
-        )
-        mock_service.validate_document.return_value = mock_response
-
-        files = [mock_file('test.pdf')]
-        response = authenticated_client.post(
-            '/v1/documents/validate', files=files
-        )
+        files = [tiny_files['.pdf']]
+        response = await aclient.post('/v1/documents/validate', files=files)
 
         assert response.status_code == 200
-        mock_service.validate_document.assert_called_once()
+        mock_core_service.validate_document.assert_called_once()
 
         data = response.json()
         assert data['is_valid'] is True
@@ -162,79 +187,114 @@ class TestValidateDocument:
         assert data['error'] is None
         assert 'content-type' in response.headers
 
-    @patch('routers.v1.documents.api_document_router.core_service')
-    def test_validate_document_invalid(
-        self, mock_service, authenticated_client, mock_file
+    async def test_validate_document_invalid(
+        self, mock_core_service, aclient, tiny_files
     ):
         """Test validation of unsupported document format."""
-        from models.document_model import ValidationResponse
+        mock_core_service.validate_document.return_value = _INVALID_RESP
 
-        mock_response = ValidationResponse(
-            is_valid=False, filename='test.xyz', is_supported_format=False,
-            error='Unsupported file format'
-        )
-        mock_service.validate_document.return_value = mock_response
-
-        files = [mock_file('test.xyz')]
-        response = authenticated_client.post(
-            '/v1/documents/validate', files=files
-        )
+        files = [tiny_files['.xyz']]
+        response = await aclient.post('/v1/documents/validate', files=files)
 
         assert response.status_code == 200
         data = response.json()
         assert data['is_valid'] is False
         assert 'Unsupported file format' in data['error']
 
-    def test_validate_document_no_file(self, authenticated_client):
+    async def test_validate_document_no_file(self, aclient):
         """Test validation without file returns 422."""
-        response = authenticated_client.post('/v1/documents/validate')
+        response = await aclient.post('/v1/documents/validate')
         assert response.status_code == 422
 
-    @patch('routers.v1.documents.api_document_router.core_service')
-    def test_validate_document_server_error(
-        self, mock_service, authenticated_client, mock_file
+    async def test_validate_document_server_error(
+        self, mock_core_service, aclient, tiny_files
     ):
         """Test validation with server error returns 500."""
-        mock_service.validate_document.side_effect = Exception(
+        mock_core_service.validate_document.side_effect = Exception(
             'Validation failed'
         )
 
-        files = [mock_file('test.txt')]
-        response = authenticated_client.post(
-            '/v1/documents/validate', files=files
-        )
+        files = [tiny_files['.txt']]
+        response = await aclient.post('/v1/documents/validate', files=files)
 
         assert response.status_code == 500
         data = response.json()
         assert 'Error validating document' in data['detail']
 
 
-class TestDocumentRouterIntegration:
-    """Integration tests for the document router."""
+class TestValidateDocumentFilename:
+    """Tests for the filename-only validate endpoint."""
+
+    def test_validate_filename_supported(self, authenticated_client):
+        """Test filename-only validation of a supported format."""
+        response = authenticated_client.post(
+            '/v1/documents/validate-filename', data={'filename': 'test.pdf'}
+        )
 
-    def test_all_endpoints_accessible(self, authenticated_client):
-        """Test that all document endpoints are accessible."""
-        # GET endpoint
-        response = authenticated_client.get('/v1/documents/supported-formats')
         assert response.status_code == 200
+        data = response.json()
+        assert data['is_valid'] is True
+        assert data['filename'] == 'test.pdf'
+        assert data['is_supported_format'] is True
+        assert data['error'] is None
 
-        # POST endpoints (should return 422 without files, not 404)
-        for endpoint in ['/v1/documents', '/v1/documents/validate']:
-            response = authenticated_client.post(endpoint)
-            assert response.status_code == 422
-            assert 'application/json' in response.headers['content-type']
+    def test_validate_filename_unsupported(self, authenticated_client):
+        """Test filename-only validation of an unsupported format."""
+        response = authenticated_client.post(
+            '/v1/documents/validate-filename', data={'filename': 'test.xyz'}
+        )
 
-    def test_openapi_documentation_generation(self, authenticated_client):
-        """Test that router contributes to OpenAPI docs."""
-        response = authenticated_client.get('/openapi.json')
         assert response.status_code == 200
+        data = response.json()
+        assert data['is_valid'] is False
+        assert 'Unsupported file format' in data['error']
 
-        paths = response.json().get('paths', {})
-        expected_paths = [
-            '/v1/documents/supported-formats',
-            '/v1/documents',
-            '/v1/documents/validate'
+    def test_validate_filename_missing(self, authenticated_client):
+        """Test filename-only validation without a filename returns 422."""
+        response = authenticated_client.post(
+            '/v1/documents/validate-filename'
+        )
+        assert response.status_code == 422
+
+
+class TestDocumentRouterIntegration:
+    """Integration tests for the document router."""
+
+    @pytest.mark.parametrize(
+        'endpoint', ['/v1/documents', '/v1/documents/validate']
+    )
+    def test_post_without_file_returns_422(
+        self, authenticated_client, endpoint
+    ):
+        """Test POST endpoints reject a missing file (422, not 404)."""
+        response = authenticated_client.post(endpoint)
+        assert response.status_code == 422
+        assert 'application/json' in response.headers['content-type']
+
+    def test_convert_document_end_to_end(self, authenticated_client):
+        """Test a real upload through the unmocked service stack.
+
+        This exercises the spooled upload file that the mocked and
+        FakeUpload-based tests never touch.
+        """
+        files = [
+            ('file', ('real.txt', b'# Heading\n\nBody text.', 'text/plain'))
         ]
+        response = authenticated_client.post('/v1/documents', files=files)
 
-        for path in expected_paths:
-            assert path in paths
+        assert response.status_code == 200
+        data = response.json()
+        assert 'Body text.' in data['markdown']
+        assert data['metadata']['filename'] == 'real.txt'
+
+    @pytest.mark.parametrize('path,methods', [
+        ('/v1/documents/supported-formats', {'get'}),
+        ('/v1/documents', {'post'}),
+        ('/v1/documents/validate', {'post'}),
+    ])
+    def test_openapi_documentation_generation(
+        self, openapi_schema, path, methods
+    ):
+        """Test that router paths and methods appear in OpenAPI docs."""
+        entry = openapi_schema['paths'][path]
+        assert methods.issubset(entry.keys())
@@ -1,20 +1,11 @@
 """Tests for main API router."""
 
-import pytest
-from fastapi.testclient import TestClient
-
-from main import app
 from models.main_router_model import OperationalStatus
 
 
 class TestApiMainRouter:
     """Tests for API v1 main router."""
 
-    @pytest.fixture
-    def client(self):
-        """Test client for the FastAPI app."""
-        return TestClient(app)
-
     def test_v1_endpoint(self, client):
         """Test the /v1 endpoint."""
         response = client.get('/v1')
@@ -22,3 +13,19 @@ class TestApiMainRouter:
 
         response_data = OperationalStatus(**response.json())
         assert response_data.operational is True
+
+    def test_v1_endpoint_caching_headers(self, client):
+        """Test the /v1 endpoint emits caching headers and honors ETag."""
+        response = client.get('/v1')
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == \
+            'public, max-age=3600, immutable'
+        assert 'ETag' in response.headers
+
+        revalidation = client.get(
+            '/v1', headers={'If-None-Match': response.headers['ETag']}
+        )
+        assert revalidation.status_code == 304
+        assert revalidation.headers['ETag'] == response.headers['ETag']
+        assert revalidation.headers['Cache-Control'] == \
+            response.headers['Cache-Control']
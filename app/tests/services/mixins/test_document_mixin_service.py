@@ -1,12 +1,24 @@
 """Tests for document mixin service."""
 
+import io
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 from services.mixins.document_mixin_service import DocumentMixinService
 from models.document_model import ValidationResponse
 
 
+@pytest.fixture(scope='module')
+def pure_service():
+    """A read-only DocumentMixinService shared across the module.
+
+    Safe to reuse: the extension and validation tests never mutate it.
+    """
+    return DocumentMixinService()
+
+
 @pytest.fixture
 def service():
     """Create a DocumentMixinService instance."""
@@ -15,15 +27,54 @@ def service():
     return service
 
 
+class _SparseStream:
+    """A file-like object that reports a size without backing bytes.
+
+    The oversize check in process_document only seeks and tells, so
+    the test payload never has to be materialized.
+    """
+
+    def __init__(self, size):
+        self._size = size
+        self._position = 0
+
+    def seek(self, position, whence=io.SEEK_SET):
+        self._position = self._size if whence == io.SEEK_END else position
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+class FakeUpload:
+    """Minimal stand-in for UploadFile.
+
+    Plain attribute access is far cheaper than MagicMock's per-lookup
+    child resolution, and the tests only touch these members.
+    """
+
+    def __init__(self, filename, content):
+        self.filename = filename
+        self.file = io.BytesIO(content)
+
+    async def read(self):
+        return self.file.read()
+
+    async def seek(self, position):
+        self.file.seek(position)
+
+
+@pytest.fixture(scope='module')
+def supported_extensions(pure_service):
+    """The supported extensions tuple, fetched once per module."""
+    return pure_service.get_supported_extensions()
+
+
 @pytest.fixture
 def mock_upload_file():
     """Create a mock UploadFile."""
     def _create_file(filename='test.txt', content=b'test'):
-        mock_file = MagicMock()
-        mock_file.filename = filename
-        mock_file.read = AsyncMock(return_value=content)
-        mock_file.seek = AsyncMock()
-        return mock_file
+        return FakeUpload(filename, content)
     return _create_file
 
 
@@ -39,50 +90,47 @@ class TestDocumentMixinService:
 class TestGetSupportedExtensions:
     """Tests for get_supported_extensions method."""
 
-    def test_get_supported_extensions(self):
+    def test_get_supported_extensions(self, supported_extensions):
         """Test getting supported extensions."""
-        service = DocumentMixinService()
-        extensions = service.get_supported_extensions()
+        assert isinstance(supported_extensions, tuple)
+        assert '.pdf' in supported_extensions
+        assert '.txt' in supported_extensions
+        assert '.docx' in supported_extensions
+        # Should be sorted
+        assert list(supported_extensions) == sorted(supported_extensions)
 
-        assert isinstance(extensions, list)
-        assert '.pdf' in extensions
-        assert '.txt' in extensions
-        assert '.docx' in extensions
-        assert extensions == sorted(extensions)  # Should be sorted
+    def test_get_supported_extensions_precomputed(
+        self, pure_service, supported_extensions
+    ):
+        """Test repeated calls return the same precomputed tuple."""
+        assert pure_service.get_supported_extensions() \
+            is supported_extensions
 
 
 class TestIsFileSupported:
     """Tests for _is_file_supported method."""
 
-    def test_supported_file(self):
-        """Test with supported file extension."""
-        service = DocumentMixinService()
-        assert service._is_file_supported('test.pdf') is True
-        assert service._is_file_supported('document.docx') is True
-        assert service._is_file_supported('readme.txt') is True
-
-    def test_unsupported_file(self):
-        """Test with unsupported file extension."""
-        service = DocumentMixinService()
-        assert service._is_file_supported('test.xyz') is False
-        assert service._is_file_supported('image.jpg') is False
-
-    def test_no_extension(self):
-        """Test with file without extension."""
-        service = DocumentMixinService()
-        assert service._is_file_supported('README') is False
+    @pytest.mark.parametrize('filename,expected', [
+        ('test.pdf', True),
+        ('document.docx', True),
+        ('readme.txt', True),
+        ('test.xyz', False),
+        ('image.jpg', False),
+        ('README', False),
+    ])
+    def test_is_file_supported(self, pure_service, filename, expected):
+        """Test supported, unsupported, and extensionless filenames."""
+        assert pure_service._is_file_supported(filename) is expected
 
 
 class TestValidateDocument:
     """Tests for validate_document method."""
 
-    def test_validate_valid_file(self):
+    def test_validate_valid_file(self, pure_service):
         """Test validation of valid file."""
-        service = DocumentMixinService()
-        mock_file = MagicMock()
-        mock_file.filename = 'test.pdf'
+        mock_file = SimpleNamespace(filename='test.pdf')
 
-        result = service.validate_document(mock_file)
+        result = pure_service.validate_document(mock_file)
 
         assert isinstance(result, ValidationResponse)
         assert result.is_valid is True
@@ -90,13 +138,11 @@ class TestValidateDocument:
         assert result.is_supported_format is True
         assert result.error is None
 
-    def test_validate_invalid_file(self):
+    def test_validate_invalid_file(self, pure_service):
         """Test validation of invalid file."""
-        service = DocumentMixinService()
-        mock_file = MagicMock()
-        mock_file.filename = 'test.xyz'
+        mock_file = SimpleNamespace(filename='test.xyz')
 
-        result = service.validate_document(mock_file)
+        result = pure_service.validate_document(mock_file)
 
         assert isinstance(result, ValidationResponse)
         assert result.is_valid is False
@@ -104,22 +150,18 @@ class TestValidateDocument:
         assert result.is_supported_format is False
         assert 'Unsupported file format' in result.error
 
-    def test_validate_no_file(self):
+    def test_validate_no_file(self, pure_service):
         """Test validation with no file."""
-        service = DocumentMixinService()
-
-        result = service.validate_document(None)
+        result = pure_service.validate_document(None)
 
         assert result.is_valid is False
         assert 'File must be provided' in result.error
 
-    def test_validate_no_filename(self):
+    def test_validate_no_filename(self, pure_service):
         """Test validation with file but no filename."""
-        service = DocumentMixinService()
-        mock_file = MagicMock()
-        mock_file.filename = None
+        mock_file = SimpleNamespace(filename=None)
 
-        result = service.validate_document(mock_file)
+        result = pure_service.validate_document(mock_file)
 
         assert result.is_valid is False
         assert 'File must be provided' in result.error
@@ -128,7 +170,6 @@ class TestValidateDocument:
 class TestProcessDocument:
     """Tests for process_document method."""
 
-    @pytest.mark.asyncio
     async def test_process_valid_document(self, service, mock_upload_file):
         """Test processing a valid document."""
         # Setup
@@ -144,13 +185,11 @@ class TestProcessDocument:
         assert result.markdown == '# Test\n\nConverted content'
         assert result.metadata.filename == 'test.txt'
 
-    @pytest.mark.asyncio
     async def test_process_no_file(self, service):
         """Test processing with no file."""
         with pytest.raises(ValueError, match='Valid file with filename'):
             await service.process_document(None)
 
-    @pytest.mark.asyncio
     async def test_process_unsupported_format(self, service, mock_upload_file):
         """Test processing unsupported file format."""
         mock_file = mock_upload_file('test.xyz', b'content')
@@ -158,7 +197,6 @@ class TestProcessDocument:
         with pytest.raises(ValueError, match='Unsupported file format'):
             await service.process_document(mock_file)
 
-    @pytest.mark.asyncio
     async def test_process_empty_file(self, service, mock_upload_file):
         """Test processing empty file."""
         mock_file = mock_upload_file('test.txt', b'')
@@ -166,16 +204,14 @@ class TestProcessDocument:
         with pytest.raises(ValueError, match='File content is empty'):
             await service.process_document(mock_file)
 
-    @pytest.mark.asyncio
     async def test_process_large_file(self, service, mock_upload_file):
         """Test processing file that's too large."""
-        large_content = b'x' * (11 * 1024 * 1024)  # 11MB
-        mock_file = mock_upload_file('test.txt', large_content)
+        mock_file = mock_upload_file('test.txt', b'')
+        mock_file.file = _SparseStream(11 * 1024 * 1024)  # 11MB
 
         with pytest.raises(ValueError, match='File size.*exceeds maximum'):
             await service.process_document(mock_file)
 
-    @pytest.mark.asyncio
     async def test_process_conversion_error(self, service, mock_upload_file):
         """Test processing with conversion error."""
         mock_file = mock_upload_file('test.txt', b'content')
@@ -3,7 +3,6 @@
 import pytest
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.testclient import TestClient
 
 from main import app
 
@@ -11,33 +10,24 @@ from main import app
 class TestFastAPIApp:
     """Tests for the main FastAPI application."""
 
-    @pytest.fixture
-    def client(self):
-        """Test client for the FastAPI app."""
-        return TestClient(app)
+    @pytest.fixture(scope='module')
+    def middleware_by_cls(self):
+        """Index the middleware stack by class, built once per module."""
+        return {
+            middleware.cls: middleware for middleware in app.user_middleware
+        }
 
     def test_app_instance(self):
         """Test that app is a FastAPI instance."""
         assert isinstance(app, FastAPI)
 
-    def test_cors_middleware_configured(self):
+    def test_cors_middleware_configured(self, middleware_by_cls):
         """Test that CORS middleware is properly configured."""
-        # Check that CORS middleware is in the middleware stack
-        middleware_classes = [
-            middleware.cls for middleware in app.user_middleware
-        ]
-        assert CORSMiddleware in middleware_classes
+        assert CORSMiddleware in middleware_by_cls
 
-    def test_cors_middleware_settings(self):
+    def test_cors_middleware_settings(self, middleware_by_cls):
         """Test CORS middleware configuration settings."""
-        # Find the CORS middleware configuration
-        cors_middleware = None
-        for middleware in app.user_middleware:
-            if middleware.cls == CORSMiddleware:
-                cors_middleware = middleware
-                break
-
-        assert cors_middleware is not None
+        cors_middleware = middleware_by_cls[CORSMiddleware]
 
         # Check CORS configuration
         kwargs = cors_middleware.kwargs